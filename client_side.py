@@ -1,18 +1,23 @@
 import socket
 import struct
 import os
-from enum import Enum
+import io
+from contextlib import contextmanager
+from enum import IntEnum
+from itertools import islice
+from typing import BinaryIO, Callable, Iterator, Optional
+import time
 import traceback
 
 
-class OpCode(Enum):
+class OpCode(IntEnum):
     SAVE_FILE = 100
     RETRIEVE_FILE = 200
     DELETE_FILE = 201
     LIST_FILES = 202
 
 
-class ResponseStatus(Enum):
+class ResponseStatus(IntEnum):
     # Success:
     FILE_RETRIEVED = 210
     FILE_LIST_RETRIEVED = 211
@@ -24,19 +29,28 @@ class ResponseStatus(Enum):
     SERVER_ERROR = 1003
 
 
-class FieldSize(Enum):  # in bytes
-    # header sizes
-    USER_ID = 4
-    VERSION = 1
-    OP = 1
-    NAME_LEN = 2
+USER_ID_SIZE = 4  # in bytes
 
-    # payload sizes
-    FILE_SIZE = 4
-    STATUS = 2
+# Wire formats, compiled once (their `size` is the field sizes in bytes).
+# < means little endian, s means raw bytes, I means unsigned int, B means unsigned char, H means unsigned short
+_HDR_NOFILE = struct.Struct(f"<{USER_ID_SIZE}sBB")  # User_ID, Version (1 byte), OpCode (1 byte)
+_HDR_NAMED = struct.Struct(f"<{USER_ID_SIZE}sBBH")  # User_ID, Version (1 byte), OpCode (1 byte), name_len (2 bytes)
+_FILE_SZ = struct.Struct("<I")  # File Size (4 bytes)
+_STATUS = struct.Struct("<BH")  # Version (1 byte), Status (2 bytes)
+_NAME_LEN = struct.Struct("<H")  # Name Length (2 bytes)
 
+# SO_SNDBUF / SO_RCVBUF size in bytes (e.g. 2 ** 20). 0 keeps the kernel's autotuning, which explicit sizes disable
+SOCKET_BUFFER_SIZE = int(os.environ.get("SOCKET_BUFFER_SIZE", 0))
 
-def read_server_info() -> tuple:
+# handle_*_response(client_socket, *args)
+ResponseHandler = Callable[..., None]
+
+RETRY_BACKOFF = 0.5  # seconds before the first retry of a failed request, doubled on every retry
+
+MSG_WAITALL = getattr(socket, "MSG_WAITALL", 0)  # not available on every platform
+
+
+def read_server_info() -> tuple[str, int]:
     """Reads the server info from the server.info file and returns a tuple of (server_ip, server_port)"""
     with open("server.info", "r") as server_info_file:
         server_info = server_info_file.readline().strip()
@@ -44,167 +58,403 @@ def read_server_info() -> tuple:
     return server_ip, int(server_port)
 
 
-def get_local_filenames() -> list:
-    """Reads the backup.info file and returns a list of the local filenames"""
+def get_local_filenames(count: Optional[int] = None) -> list[str]:
+    """Reads the backup.info file and returns a list of the local filenames (only the first `count`, if given)"""
     with open("backup.info", "r") as backup_info_file:
-        return [line.strip() for line in backup_info_file.readlines()]
-
-
-def get_file_bytes(filename: str) -> bytes:
-    """Reads the file with the given filename and returns its bytes"""
-    with open(filename, "rb") as file:
-        return file.read()
+        return [line.strip() for line in islice(backup_info_file, count)]
 
 
 def create_unique_user_id() -> bytes:
     """Creates a unique user ID (4 bytes)"""
-    return os.urandom(FieldSize.USER_ID.value)
+    return os.urandom(USER_ID_SIZE)
 
 
-def send_request(client_socket: socket.socket, user_id: bytes, version: int, op_code: OpCode, filename: str = "") -> None:
-    """Sends a request to the server with the given parameters
-    If the request is a SAVE_FILE request, the filename parameter must be given
+def send_file(client_socket: socket.socket, file: BinaryIO, file_size: int) -> None:
+    """Streams the given file to the socket, without reading it into memory"""
+    if not file_size:  # nothing to send (and socket.sendfile rejects a count of 0)
+        return
+    # os.sendfile writes to the descriptor directly, so it's only used for plain sockets (it would bypass e.g. TLS)
+    if not hasattr(os, "sendfile") or type(client_socket) is not socket.socket:
+        offset = client_socket.sendfile(file, 0, file_size)  # uses os.sendfile when it can, send otherwise
+    else:
+        offset = 0
+        while offset < file_size:
+            sent = os.sendfile(client_socket.fileno(), file.fileno(), offset, file_size - offset)
+            if sent == 0:
+                break
+            offset += sent
+    if offset < file_size:
+        # The header promised file_size bytes, so the server would read the following requests as the file content.
+        # Stop sending instead (the responses to the requests sent so far can still be received)
+        client_socket.shutdown(socket.SHUT_WR)
+        raise OSError(f"{file.name} was truncated while sending ({offset} of {file_size} bytes sent)")
+
+
+@contextmanager
+def corked(client_socket: socket.socket) -> Iterator[None]:
+    """Holds back partial segments (TCP_CORK) until the block exits. Does nothing where TCP_CORK is unavailable"""
+    if not hasattr(socket, "TCP_CORK"):  # Linux only
+        yield
+        return
+    client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 1)
+    try:
+        yield
+    finally:
+        client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 0)  # flushes the pending data
+
+
+def send_request(client_socket: socket.socket, user_id: bytes, version: int, op_code: OpCode, *,
+                 fname_bytes: bytes = b"", file: Optional[BinaryIO] = None, file_size: Optional[int] = None,
+                 pending: Optional[bytearray] = None) -> None:
+    """Sends a request to the server with the given parameters (the filename is given already encoded)
+    If the request is a SAVE_FILE request, the open file and its size must be given as well
+    If `pending` is given, the request is appended to it to be sent later along with other requests
+    (a SAVE_FILE request sends everything pending, since its file content is streamed directly to the socket)
     """
-    if not filename:
-        package = struct.pack("<IBB", int.from_bytes(user_id, byteorder='big'), version, op_code.value)
+    save_file = op_code == OpCode.SAVE_FILE
+
+    # Allocate the whole header once and pack the fields into it
+    name_offset = _HDR_NAMED.size if fname_bytes else _HDR_NOFILE.size
+    package = bytearray(name_offset + len(fname_bytes) + (_FILE_SZ.size if save_file else 0))
+    if not fname_bytes:
+        _HDR_NOFILE.pack_into(package, 0, user_id, version, op_code)
     else:
-        # Format: User_ID (4 bytes), Version (1 byte), OpCode (1 byte), name_len (2 bytes)
-        # < means little endian, `I` means unsigned int, B means unsigned char, H means unsigned short
-        package = struct.pack("<IBBH", int.from_bytes(user_id, byteorder='big'), version, op_code.value, len(filename))
-        package += filename.encode()
+        _HDR_NAMED.pack_into(package, 0, user_id, version, op_code, len(fname_bytes))
+        package[name_offset:name_offset + len(fname_bytes)] = fname_bytes
+
+    if not save_file:
+        if pending is not None:
+            pending += package
+        else:
+            client_socket.sendall(package)
+        return
+
+    if file is None or file_size is None:
+        raise ValueError("A SAVE_FILE request needs the open file and its size")
+    # Send only the header from userspace, the file content is copied by the kernel
+    _FILE_SZ.pack_into(package, len(package) - _FILE_SZ.size, file_size)
+    if pending:
+        pending += package
+        package = pending
+    try:
+        with corked(client_socket):  # so the small header goes out in the same segment as the file content
+            client_socket.sendall(package)
+            send_file(client_socket, file, file_size)
+    finally:
+        if pending:
+            pending.clear()  # sent, or failed along with this request
 
-    if op_code == OpCode.SAVE_FILE:
-        file_content = get_file_bytes(filename)
-        package += struct.pack("<I", len(file_content))
-        package += file_content  # it's already bytes, so no need to pack it
-    client_socket.send(package)
+
+def send_save_request(client_socket: socket.socket, user_id: bytes, version: int, filename: str,
+                      pending: Optional[bytearray] = None) -> None:
+    """Sends a SAVE_FILE request with the file with the given filename"""
+    with open(filename, "rb") as file:
+        file_size = os.fstat(file.fileno()).st_size  # of the already open file, to avoid another path lookup
+        send_request(client_socket, user_id, version, OpCode.SAVE_FILE,
+                     fname_bytes=filename.encode(), file=file, file_size=file_size, pending=pending)
+
+
+def receive_exactly(client_socket: socket.socket, size: int) -> bytes:
+    """Receives exactly `size` bytes from the socket, since recv may return fewer bytes than requested"""
+    data = client_socket.recv(size, MSG_WAITALL)  # usually gets everything in a single call
+    while len(data) < size:
+        chunk = client_socket.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("Connection closed by the server")
+        data += chunk
+    return data
 
 
 def receive_status(client_socket: socket.socket) -> int:
     """Receives the version and status code from the server and returns the status"""
-    header = client_socket.recv(FieldSize.VERSION.value + FieldSize.STATUS.value)
-    version, status = struct.unpack("<BH", header)  # Format: B = unsigned char (1 byte), H = unsigned short (2 bytes)
+    header = receive_exactly(client_socket, _STATUS.size)
+    version: int
+    status: int
+    version, status = _STATUS.unpack(header)
     return status
 
 
 def receive_filename(client_socket: socket.socket) -> str:
     """Receives the filename from the server and returns it"""
-    name_len = struct.unpack("<H", client_socket.recv(FieldSize.NAME_LEN.value))[0]  # Format: Name Length (2 bytes)
-    filename = client_socket.recv(name_len).decode()
+    name_len: int = _NAME_LEN.unpack(receive_exactly(client_socket, _NAME_LEN.size))[0]
+    filename = receive_exactly(client_socket, name_len).decode()
     return filename
 
 
-def receive_file(client_socket: socket.socket, filename: str) -> None:
-    """Receives a file (one chunk at a time) from the socket and saves it to the given filename"""
-    file_size = struct.unpack("<I", client_socket.recv(FieldSize.FILE_SIZE.value))[0]
-    buffer_size = 2 ** 12
-    with open(filename, "wb") as file:
-        # Use a loop to receive and write the file in chunks
-        while file_size > 0:
-            chunk = client_socket.recv(buffer_size)
-            if not chunk:
-                break
-            file.write(chunk)
-            file_size -= len(chunk)
+def receive_file_size(client_socket: socket.socket) -> int:
+    """Receives the size of the file that follows from the server and returns it"""
+    file_size: int = _FILE_SZ.unpack(receive_exactly(client_socket, _FILE_SZ.size))[0]
+    return file_size
 
 
-def request_file_list(client_socket: socket.socket, user_id: bytes, version: int):
-    """Requests the list of files from the server and prints it to the console"""
-    send_request(client_socket, user_id, version, OpCode.LIST_FILES)
+def receive_chunks(client_socket: socket.socket, writer: BinaryIO, file_size: int) -> None:
+    """Receives `file_size` bytes (one chunk at a time) from the socket and writes them to the given writer"""
+    buffer_size = 2 ** 16
+    buffer = memoryview(bytearray(buffer_size))  # reused for every chunk
+    # Use a loop to receive and write the file in chunks
+    while file_size > 0:
+        chunk_size = client_socket.recv_into(buffer, min(buffer_size, file_size))
+        if not chunk_size:
+            break
+        writer.write(buffer[:chunk_size])
+        file_size -= chunk_size
+
+
+def receive_into(client_socket: socket.socket, writer: BinaryIO) -> None:
+    """Receives a file from the socket and writes it to the given writer"""
+    receive_chunks(client_socket, writer, receive_file_size(client_socket))
+
+
+def splice_into(client_socket: socket.socket, file: BinaryIO, file_size: int) -> None:
+    """Moves `file_size` bytes from the socket to the given file, without copying them through userspace.
+    splice requires one of its ends to be a pipe, so the data is moved socket -> pipe -> file by the kernel.
+    If splice fails before anything reached the file (e.g. EINVAL, where the file system doesn't support it),
+    the rest is received with receive_chunks instead
+    """
+    chunk_size = 2 ** 16  # the default pipe capacity
+    spliced = 0  # bytes already moved to the file
+    in_pipe = 0
+    pipe_read, pipe_write = os.pipe()
+    try:
+        try:
+            while file_size > 0:
+                in_pipe = os.splice(client_socket.fileno(), pipe_write, min(chunk_size, file_size),
+                                    flags=os.SPLICE_F_MOVE)
+                if not in_pipe:
+                    return
+                file_size -= in_pipe
+                while in_pipe > 0:
+                    moved = os.splice(pipe_read, file.fileno(), in_pipe, flags=os.SPLICE_F_MOVE)
+                    in_pipe -= moved
+                    spliced += moved
+            return
+        except OSError:
+            if spliced:
+                raise
+        while in_pipe > 0:  # already moved from the socket to the pipe, before splicing to the file failed
+            data = os.read(pipe_read, in_pipe)
+            file.write(data)
+            in_pipe -= len(data)
+    finally:
+        os.close(pipe_read)
+        os.close(pipe_write)
+    receive_chunks(client_socket, file, file_size)
+
+
+def receive_file(client_socket: socket.socket, filename: str) -> None:
+    """Receives a file from the socket and saves it to the given filename"""
+    file_size = receive_file_size(client_socket)
+    with open(filename, "wb", buffering=2 ** 20) as file:  # fewer write syscalls than the default 8 KiB buffer
+        # splice reads the descriptor directly, so it's only used for plain sockets (it would bypass e.g. TLS)
+        if hasattr(os, "splice") and type(client_socket) is socket.socket:  # Linux only, Python 3.10+
+            splice_into(client_socket, file, file_size)
+        else:
+            receive_chunks(client_socket, file, file_size)
+
+
+def handle_list_response(client_socket: socket.socket) -> None:
+    """Receives the response to a LIST_FILES request and prints the list of files to the console"""
     status = receive_status(client_socket)
-    if status == ResponseStatus.FILE_LIST_RETRIEVED.value:
-        filename = receive_filename(client_socket)
-        receive_file(client_socket, filename)
-        with open(filename, "rb") as file:
-            file_content = file.read()
+    if status == ResponseStatus.FILE_LIST_RETRIEVED:
+        receive_filename(client_socket)  # the name of the list file on the server, not needed here
+        file_content = io.BytesIO()  # the list is only printed, so there's no need to save it to disk
+        receive_into(client_socket, file_content)
         print("List of files on server:")
-        print(file_content.decode("utf-8"))
-    elif status == ResponseStatus.NO_USER_FILES.value:
+        print(file_content.getvalue().decode("utf-8"))
+    elif status == ResponseStatus.NO_USER_FILES:
         print("No files on server")
     else:
         print("Wrong status code")
 
 
-def request_file_save(client_socket: socket.socket, user_id: bytes, version: int, filename: str):
-    """Sends a SAVE_FILE request to the server with the given filename, and prints the result to the console"""
-    send_request(client_socket, user_id, version, OpCode.SAVE_FILE, filename)
+def handle_save_response(client_socket: socket.socket, filename: str) -> None:
+    """Receives the response to a SAVE_FILE request and prints the result to the console"""
     status = receive_status(client_socket)
-    if status == ResponseStatus.SUCCESS.value:
+    if status == ResponseStatus.SUCCESS:
         filename = receive_filename(client_socket)
         print(f"Saved {filename} to server")
-    elif status == ResponseStatus.NO_FILE.value:
+    elif status == ResponseStatus.NO_FILE:
         print(f"No such file {filename} on client")
     else:
         print("Wrong status code")
 
 
-def request_file_retrieve(client_socket: socket.socket, user_id: bytes, version: int, filename: str):
-    """Sends a RETRIEVE_FILE request to the server with the given filename, and prints the result to the console"""
-    send_request(client_socket, user_id, version, OpCode.RETRIEVE_FILE, filename)
+def handle_retrieve_response(client_socket: socket.socket, filename: str) -> None:
+    """Receives the response to a RETRIEVE_FILE request, saves the file and prints the result to the console"""
     status = receive_status(client_socket)
-    if status == ResponseStatus.FILE_RETRIEVED.value:
+    if status == ResponseStatus.FILE_RETRIEVED:
         filename = receive_filename(client_socket)
         receive_file(client_socket, "tmp")
         print(f"Retrieved {filename} from server")
-    elif status == ResponseStatus.NO_FILE.value:
+    elif status == ResponseStatus.NO_FILE:
         print("No such file on server")
     else:
         print("Wrong status code")
 
 
-def request_file_delete(client_socket: socket.socket, user_id: bytes, version: int, filename: str):
-    """Sends a DELETE_FILE request to the server with the given filename, and prints the result to the console"""
-    send_request(client_socket, user_id, version, OpCode.DELETE_FILE, filename)
+def handle_delete_response(client_socket: socket.socket, filename: str) -> None:
+    """Receives the response to a DELETE_FILE request and prints the result to the console"""
     status = receive_status(client_socket)
-    if status == ResponseStatus.SUCCESS.value:
+    if status == ResponseStatus.SUCCESS:
         filename = receive_filename(client_socket)
         print(f"Deleted {filename} from server")
-    elif status == ResponseStatus.NO_FILE.value:
+    elif status == ResponseStatus.NO_FILE:
         print("No such file on server")
     else:
         print("Wrong status code")
 
 
-def request(request_function: callable, server_ip: str, server_port: int, user_id: bytes, *args):
-    """Connects to the server and calls the given request function with the given arguments"""
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as client_socket:
+def configure_socket(client_socket: socket.socket) -> None:
+    """Disables Nagle's algorithm (so the small headers aren't delayed) and sets the buffer sizes, if configured"""
+    client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    if SOCKET_BUFFER_SIZE:
+        client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+        client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+
+
+def open_connection(server_ip: str, server_port: int) -> socket.socket:
+    """Creates a socket and connects it to the server"""
+    client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        configure_socket(client_socket)
+        client_socket.connect((server_ip, server_port))
+    except Exception:
+        client_socket.close()
+        raise
+    return client_socket
+
+
+def connect(server_ip: str, server_port: int, retries: int = 3) -> socket.socket:
+    """Connects to the server and returns the connected socket
+    If the connection fails (refused, reset or timed out), tries again up to `retries` times, with exponential backoff.
+    Only connecting is retried, since nothing was sent yet (a request might have reached the server already)
+    """
+    for attempt in range(retries):
+        try:
+            return open_connection(server_ip, server_port)
+        except (ConnectionError, TimeoutError):
+            time.sleep(RETRY_BACKOFF * 2 ** attempt)
+    return open_connection(server_ip, server_port)
+
+
+class ClientSession:
+    """A single connection to the server, reused for several requests (saves a TCP handshake per request)"""
+
+    def __init__(self, server_ip: str, server_port: int, user_id: bytes, version: int, retries: int = 3) -> None:
+        self.server_ip = server_ip
+        self.server_port = server_port
+        self.user_id = user_id
+        self.version = version
+        self.retries = retries  # of connecting to the server (see `connect`)
+        self.client_socket: socket.socket  # connected on __enter__
+        # While pipelining: the requests that weren't sent yet, and the handlers of the responses that weren't read yet
+        self.pending_requests: Optional[bytearray] = None
+        self.pending_responses: Optional[list[tuple[ResponseHandler, tuple[str, ...]]]] = None
+
+    def __enter__(self) -> "ClientSession":
+        self.client_socket = connect(self.server_ip, self.server_port, self.retries)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.client_socket.close()
+
+    @contextmanager
+    def pipeline(self) -> Iterator["ClientSession"]:
+        """Sends all the requests made inside the block back-to-back, then handles their responses in order.
+        Saves a round trip per request, but the responses are only read once everything was sent,
+        so large retrieves should come last (otherwise the server may block on a full socket buffer)
+        """
+        pending_requests = bytearray()
+        pending_responses: list[tuple[ResponseHandler, tuple[str, ...]]] = []
+        self.pending_requests, self.pending_responses = pending_requests, pending_responses
+        try:
+            yield self
+            try:
+                self.client_socket.sendall(pending_requests)
+            except OSError:  # e.g. an earlier request failed and ended the connection
+                print("Sending the pipelined requests failed:")
+                traceback.print_exc()
+        finally:
+            self.pending_requests = self.pending_responses = None
+        for response_handler, args in pending_responses:
+            self.handle_response(response_handler, *args)
+
+    def send(self, op_code: OpCode, response_handler: ResponseHandler, *args: str) -> None:
+        """Sends a request with the given op code and handles its response (later on, if pipelining)
+        The args (the filename, if any) are passed on to the response handler as well
+        """
+        try:
+            if op_code == OpCode.SAVE_FILE:
+                send_save_request(self.client_socket, self.user_id, self.version, args[0], self.pending_requests)
+            else:
+                send_request(self.client_socket, self.user_id, self.version, op_code,
+                             fname_bytes=args[0].encode() if args else b"", pending=self.pending_requests)
+        except (OSError, struct.error):
+            print(op_code.name + " request failed:")
+            traceback.print_exc()
+            return
+        if self.pending_responses is None:
+            self.handle_response(response_handler, *args)
+        else:
+            self.pending_responses.append((response_handler, args))
+
+    def handle_response(self, response_handler: ResponseHandler, *args: str) -> None:
+        """Calls the given response handler over the session's connection with the given arguments"""
         try:
-            client_socket.connect((server_ip, server_port))
-            request_function(client_socket, user_id, *args)
-        except Exception:
-            print(request_function.__name__ + " failed:")
+            response_handler(self.client_socket, *args)
+        except (OSError, struct.error, UnicodeDecodeError):  # a bad name or list was still received entirely
+            print(response_handler.__name__ + " failed:")
             traceback.print_exc()
 
+    def list(self) -> None:
+        """Requests the list of files from the server and prints it to the console"""
+        self.send(OpCode.LIST_FILES, handle_list_response)
+
+    def save(self, filename: str) -> None:
+        """Saves the file with the given filename to the server"""
+        self.send(OpCode.SAVE_FILE, handle_save_response, filename)
+
+    def retrieve(self, filename: str) -> None:
+        """Retrieves the file with the given filename from the server"""
+        self.send(OpCode.RETRIEVE_FILE, handle_retrieve_response, filename)
+
+    def delete(self, filename: str) -> None:
+        """Deletes the file with the given filename from the server"""
+        self.send(OpCode.DELETE_FILE, handle_delete_response, filename)
+
 
 def main() -> None:
     """Main function"""
     version = 1
     server_ip, server_port = read_server_info()
     user_id = create_unique_user_id()
-    local_filenames = get_local_filenames()
+    local_filenames = get_local_filenames(2)  # only the first two files are used
 
     try:
-        request(request_file_list, server_ip, server_port, user_id, version)
+        with ClientSession(server_ip, server_port, user_id, version) as session:
+            with session.pipeline():
+                session.list()
 
-        # Save the first file to the backup
-        request(request_file_save, server_ip, server_port, user_id, version, local_filenames[0])
+                # Save the first file to the backup
+                session.save(local_filenames[0])
 
-        # Save the second file to the backup
-        request(request_file_save, server_ip, server_port, user_id, version, local_filenames[1])
+                # Save the second file to the backup
+                session.save(local_filenames[1])
 
-        # List files again
-        request(request_file_list, server_ip, server_port, user_id, version)
+                # List files again
+                session.list()
 
-        # Retrieve and save the first file
-        request(request_file_retrieve, server_ip, server_port, user_id, version, local_filenames[0])
+                # Retrieve and save the first file
+                session.retrieve(local_filenames[0])
 
-        # Delete the first file
-        request(request_file_delete, server_ip, server_port, user_id, version, local_filenames[0])
+            with session.pipeline():
+                # Delete the first file
+                session.delete(local_filenames[0])
 
-        # Try to retrieve the deleted file (should fail)
-        request(request_file_retrieve, server_ip, server_port, user_id, version, local_filenames[0])
+                # Try to retrieve the deleted file (should fail)
+                session.retrieve(local_filenames[0])
 
-    except Exception:
+    except Exception:  # e.g. backup.info with fewer than two files, besides connection errors
         traceback.print_exc()
 
 
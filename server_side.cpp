@@ -45,42 +45,52 @@ public:
     RequestHandler(boost::asio::ip::tcp::socket socket) : socket(std::move(socket)) {}
 
     void start() {
+        // Handle requests until the client closes the connection, so the client can reuse it for several requests
+        uint8_t version = 0;
         try {
-            boost::asio::streambuf header_buffer;
-            boost::asio::read(socket, header_buffer, boost::asio::transfer_exactly(static_cast<int>(FieldSize::USER_ID) + static_cast<int>(FieldSize::VERSION) + static_cast<int>(FieldSize::OP)));
-            std::istream header_stream(&header_buffer);
-            uint32_t user_id;
-            uint8_t version
-            uint8_t op;
-            header_stream.read(reinterpret_cast<char*>(&user_id), sizeof(user_id));
-            header_stream.read(reinterpret_cast<char*>(&version), sizeof(version));           
-            header_stream.read(reinterpret_cast<char*>(&op), sizeof(op));
-            
-            
-            if (op == static_cast<uint8_t>(OpCode::LIST_FILES)) {
-                handle_list_files_request(user_id, version);
-            }
-            else {
-                boost::asio::read(socket, header_buffer, boost::asio::transfer_exactly(static_cast<int>(FieldSize::NAME_LEN)));
-
-                uint16_t name_len;
-                header_stream.read(reinterpret_cast<char*>(&name_len), sizeof(name_len));
-
-                std::string filename;
-                filename.resize(name_len);
-                boost::asio::read(socket, boost::asio::buffer(&filename[0], name_len));
-
-                if (op == static_cast<uint8_t>(OpCode::SAVE_FILE)) {
-                    handle_save_request(user_id, version, filename);
+            while (true) {
+                boost::asio::streambuf header_buffer;
+                boost::system::error_code ec;
+                boost::asio::read(socket, header_buffer, boost::asio::transfer_exactly(static_cast<int>(FieldSize::USER_ID) + static_cast<int>(FieldSize::VERSION) + static_cast<int>(FieldSize::OP)), ec);
+                if (ec == boost::asio::error::eof) {
+                    break;  // The client is done
                 }
-                else if (op == static_cast<uint8_t>(OpCode::RETRIEVE_FILE)) {
-                    handle_retrieve_request(user_id, version, filename);
+                if (ec) {
+                    throw boost::system::system_error(ec);
                 }
-                else if (op == static_cast<uint8_t>(OpCode::DELETE_FILE)) {
-                    handle_delete_request(user_id, version, filename);
+                std::istream header_stream(&header_buffer);
+                uint32_t user_id;
+                uint8_t op;
+                header_stream.read(reinterpret_cast<char*>(&user_id), sizeof(user_id));
+                header_stream.read(reinterpret_cast<char*>(&version), sizeof(version));
+                header_stream.read(reinterpret_cast<char*>(&op), sizeof(op));
+
+
+                if (op == static_cast<uint8_t>(OpCode::LIST_FILES)) {
+                    handle_list_files_request(user_id, version);
                 }
-                else { // Invalid operation
-                    send_response(version, ResponseStatus::SERVER_ERROR);
+                else {
+                    boost::asio::read(socket, header_buffer, boost::asio::transfer_exactly(static_cast<int>(FieldSize::NAME_LEN)));
+
+                    uint16_t name_len;
+                    header_stream.read(reinterpret_cast<char*>(&name_len), sizeof(name_len));
+
+                    std::string filename;
+                    filename.resize(name_len);
+                    boost::asio::read(socket, boost::asio::buffer(&filename[0], name_len));
+
+                    if (op == static_cast<uint8_t>(OpCode::SAVE_FILE)) {
+                        handle_save_request(user_id, version, filename);
+                    }
+                    else if (op == static_cast<uint8_t>(OpCode::RETRIEVE_FILE)) {
+                        handle_retrieve_request(user_id, version, filename);
+                    }
+                    else if (op == static_cast<uint8_t>(OpCode::DELETE_FILE)) {
+                        handle_delete_request(user_id, version, filename);
+                    }
+                    else { // Invalid operation
+                        send_response(version, ResponseStatus::SERVER_ERROR);
+                    }
                 }
             }
             socket.close();
@@ -95,10 +105,20 @@ public:
 private:
     boost::asio::ip::tcp::socket socket;
 
-    void send_response(uint8_t version, ResponseStatus status, const std::string& filename = "", const std::vector<uint8_t>& file_data = {}) {
+    void send_response(uint8_t version, ResponseStatus status, const std::string& filename = "") {
+        // A response without a file
+        write_response(version, status, filename, nullptr);
+    }
+
+    void send_response(uint8_t version, ResponseStatus status, const std::string& filename, const std::vector<uint8_t>& file_data) {
+        // A response with a file, whose size field is sent even if it is empty
+        write_response(version, status, filename, &file_data);
+    }
+
+    void write_response(uint8_t version, ResponseStatus status, const std::string& filename, const std::vector<uint8_t>* file_data) {
         // Send the response to the client with the following format:
         // [version (1 byte)] [status (2 bytes)] [filename length (2 bytes)] [filename (variable length)] [file size (4 bytes)] [file data (variable length)]
-        // The file size and file data fields are only sent on success, and the filename length and filename fields are only sent if a filename is provided
+        // The file size and file data fields are only sent with a file (FILE_RETRIEVED and FILE_LIST_RETRIEVED), and the filename length and filename fields are only sent if a filename is provided
         uint16_t name_len = static_cast<uint16_t>(filename.length());
         std::vector<uint8_t> response(sizeof(version) + sizeof(status) + (filename == "" ? 0 : sizeof(name_len) + name_len));
         
@@ -108,11 +128,11 @@ private:
             std::memcpy(response.data() + sizeof(version) + sizeof(status), &name_len, sizeof(name_len));
             std::memcpy(response.data() + sizeof(version) + sizeof(status) + sizeof(name_len), filename.data(), name_len);
         }
-        if (!file_data.empty()) {
-            uint32_t file_size = static_cast<uint32_t>(file_data.size());
+        if (file_data != nullptr) {
+            uint32_t file_size = static_cast<uint32_t>(file_data->size());
             response.resize(response.size() + sizeof(file_size));
             std::memcpy(response.data() + sizeof(version) + sizeof(status) + sizeof(name_len) + name_len, &file_size, sizeof(file_size));
-            response.insert(response.end(), file_data.begin(), file_data.end());
+            response.insert(response.end(), file_data->begin(), file_data->end());
         }
         try {
             boost::asio::write(socket, boost::asio::buffer(response));
@@ -129,19 +149,26 @@ private:
             boost::asio::read(socket, boost::asio::buffer(&size, sizeof(size)));
             std::string user_dir = FILE_DIR + std::to_string(user_id);
             std::string file_path = user_dir + "/" + filename;
+            const size_t buffer_size = 4096;
+            std::vector<uint8_t> buffer(buffer_size);
+
             if (size <= 0 or not validate_paths(user_dir, filename)) {
+                // Discard the file content, so the next request on this connection is read from its start
+                size_t data_discarded = 0;
+                while (data_discarded < size) {
+                    data_discarded += socket.read_some(boost::asio::buffer(buffer, std::min(buffer_size, size - data_discarded)));
+                }
                 send_response(version, ResponseStatus::SERVER_ERROR);
+                return;
             }
-            
-            const size_t buffer_size = 4096;
-            std::vector<uint8_t> buffer(buffer_size);
 
             // Open the file for writing in binary mode
             std::ofstream file(file_path, std::ios::binary);
 
             size_t data_received = 0;
             while (data_received < size) {
-                size_t recv_size = socket.read_some(boost::asio::buffer(buffer));
+                // Don't read past the file, the next request may follow on the same connection
+                size_t recv_size = socket.read_some(boost::asio::buffer(buffer, std::min(buffer_size, size - data_received)));
 
                 if (recv_size == 0)
                     break;
@@ -192,15 +219,15 @@ private:
             if (validate_paths(user_dir, filename)) {
 
                 if (std::remove((user_dir + "/" + filename).c_str()) == 0) {
-                    send_response(version, ResponseStatus::FILE_RETRIEVED, filename);
+                    send_response(version, ResponseStatus::SUCCESS, filename);
                     return;
                 }
             }
-            send_response(version, ResponseStatus::NO_FILE, filename);
+            send_response(version, ResponseStatus::NO_FILE);
             
         }
         catch (const std::exception& e) {
-            send_response(version, ResponseStatus::SERVER_ERROR, filename);
+            send_response(version, ResponseStatus::SERVER_ERROR);
         }
     }
 